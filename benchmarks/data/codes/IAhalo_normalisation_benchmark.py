@@ -28,8 +28,8 @@ def normalisation(Mhalo, cosmo, conc, z):
     Nsat_lens = HODHProf._Ns(Mhalo, 1. / (1. + z))
 
     # Get total number of satellite galaxies
-    tot_ns = scipy.integrate.simps(Ncen_lens * Nsat_lens * HMF, np.log10(Mhalo))
-    tot_nc = scipy.integrate.simps((Ncen_lens) * HMF, np.log10(Mhalo))
+    tot_ns = scipy.integrate.simpson(Ncen_lens * Nsat_lens * HMF, x=np.log10(Mhalo))
+    tot_nc = scipy.integrate.simpson((Ncen_lens) * HMF, x=np.log10(Mhalo))
 
     tot_all = tot_ns + tot_nc
 
@@ -1,6 +1,6 @@
 import pysz_gal.pysz_gal as szgal
 import numpy as np
-from scipy.integrate import simps
+from scipy.integrate import simpson
 
 
 # Set N(z)
@@ -14,7 +14,7 @@ z1 = 1e-5
 z2 = 0.1
 z_arr = np.linspace(z1, z2, 10024)
 dndz = _nz_2mrs(z_arr)
-dndz /= simps(dndz, z_arr)
+dndz /= simpson(dndz, x=z_arr)
 
 # Set things up
 pyszgal_cl = szgal.tsz_gal_cl()
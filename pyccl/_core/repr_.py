@@ -251,14 +251,12 @@ def build_string_from_attrs(self):
             halo_bias = HaloBiasTinker10,  HASH = 0x9da644b5
             mass_def = pyccl.halos.MassDef(Delta=500, rho_type=critical)
     """
-    params = {param: getattr(self, param) for param in self.__repr_attrs__}
-    defaults = {param: value.default
-                for param, value in self.__signature__.parameters.items()
-                if param != "self"}
+    params = zip(self.__repr_attrs__, self._repr_getter(self))
+    defaults = self._repr_defaults
 
     s = build_string_simple(self)
     newline = "\n\t"
-    for param, value in params.items():
+    for param, value in params:
         if param in defaults and value == defaults[param]:
             # skip printing when value is the default
             continue
@@ -4,8 +4,9 @@ __all__ = ("ObjectLock",
            "CCLObject", "CCLAutoRepr", "CCLNamedClass",)
 
 import functools
+from operator import attrgetter
 from abc import ABC, abstractmethod
-from inspect import signature
+from inspect import Parameter, signature
 from _thread import RLock
 
 import numpy as np
@@ -13,8 +14,12 @@ import numpy as np
 
 class ObjectLock:
     """Control the lock state (immutability) of a ``CCLObject``."""
-    _locked: bool = False
-    _lock_id: int = None
+    # Every CCLObject carries one of these, so keep them small.
+    __slots__ = ("_locked", "_lock_id",)
+
+    def __init__(self):
+        self._locked: bool = False
+        self._lock_id: int = None
 
     def __repr__(self):
         return f"{self.__class__.__name__}(locked={self.locked})"
@@ -53,13 +58,16 @@ class UnlockInstance:
             If the enclosed function mutates the object, the stored
             representation is automatically deleted.
     """
+    # Shared by all context managers. The critical section only touches the
+    # lock state of the enclosed instance, so one lock is enough and we avoid
+    # allocating a new one every time an instance is unlocked.
+    thread_lock = RLock()
 
     def __init__(self, instance, *, mutate=True):
         self.instance = instance
         self.mutate = mutate
         # Define these attributes for easy access.
         self.id = id(self)
-        self.thread_lock = RLock()
         # We want to catch and exit if the instance is not a CCLObject.
         # Hopefully this will be caught downstream.
         self.check_instance = isinstance(instance, CCLObject)
@@ -121,17 +129,41 @@ class UnlockInstance:
             # ensure the name makes sense
             raise NameError(f"{name} does not exist in {func.__name__}.")
 
+        # Position of the instance in `args`, if it can be passed positionally.
+        kind = func.__signature__.parameters[name].kind
+        positional = (Parameter.POSITIONAL_ONLY,
+                      Parameter.POSITIONAL_OR_KEYWORD)
+        index = names.index(name) if kind in positional else None
+
+        def get_instance(args, kwargs):
+            # Fetch the instance directly and only fall back to the (slow)
+            # signature binding if it is not found, e.g. for invalid calls.
+            if index is not None and len(args) > index:
+                return args[index]
+            if name in kwargs and kind != Parameter.POSITIONAL_ONLY:
+                return kwargs[name]
+            return func.__signature__.bind(*args, **kwargs).arguments[name]
+
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            bound = func.__signature__.bind(*args, **kwargs)
-            with UnlockInstance(bound.arguments[name], mutate=mutate):
+            instance = get_instance(args, kwargs)
+            if (not isinstance(instance, CCLObject)
+                    or instance._object_lock.active):
+                # Nothing to unlock, or an enclosing context manager is
+                # already in control of the instance.
+                return func(*args, **kwargs)
+            with UnlockInstance(instance, mutate=mutate):
                 return func(*args, **kwargs)
+        wrapper.__unlock_wrapped__ = True
         return wrapper
 
     @classmethod
     def Funlock(cls, cl, name, mutate: bool):
         """Allow an instance to change or mutate when `name` is called."""
         func = vars(cl).get(name)
+        if getattr(func, "__unlock_wrapped__", False):
+            # Already decorated; don't wrap (and inspect) it again.
+            return
         if func is not None:
             newfunc = cls.unlock_instance(mutate=mutate)(func)
             setattr(cl, name, newfunc)
@@ -149,6 +181,17 @@ def is_equal(this, other):
         return False
 
 
+def _tuple_attrgetter(attrs):
+    """Build a callable which fetches ``attrs`` from an object as a tuple."""
+    if not attrs:
+        return lambda obj: ()
+    getter = attrgetter(*attrs)
+    if len(attrs) == 1:
+        # `attrgetter` returns a bare value for a single attribute.
+        return lambda obj: (getter(obj),)
+    return getter
+
+
 class _CustomMethod:
     """Subclasses specifying a method string control whether the custom
     method is used in subclasses of ``CCLObject``.
@@ -253,7 +296,11 @@ class CCLObject(ABC):
         CustomEq.register(cls)
         CustomRepr.register(cls)
 
-        # 3. Unlock instance on specific methods.  # TODO: Uncomment for CCLv3.
+        # 3. Fetch all the attributes compared in `__eq__` in a single call.
+        if hasattr(cls, "__eq_attrs__"):
+            cls._eq_getter = staticmethod(_tuple_attrgetter(cls.__eq_attrs__))
+
+        # 4. Unlock instance on specific methods.  # TODO: Uncomment for CCLv3.
         # UnlockInstance.Funlock(cls, "__init__", mutate=False)
         # UnlockInstance.Funlock(cls, "update_parameters", mutate=True)
 
@@ -264,7 +311,9 @@ class CCLObject(ABC):
         return instance
 
     def __setattr__(self, name, value):
-        if self._object_lock.locked:
+        # This runs on every attribute assignment, so read the lock state
+        # directly rather than through the `ObjectLock.locked` property.
+        if self._object_lock._locked:
             raise AttributeError("CCL objects can only be updated via "
                                  "`update_parameters`, if implemented.")
         object.__setattr__(self, name, value)
@@ -290,9 +339,11 @@ class CCLObject(ABC):
         if type(self) is not type(other):
             return False
         # Compare the attributes listed in `__eq_attrs__`.
-        if hasattr(self, "__eq_attrs__"):
-            for attr in self.__eq_attrs__:
-                if not is_equal(getattr(self, attr), getattr(other, attr)):
+        if hasattr(self, "_eq_getter"):
+            pairs = zip(self._eq_getter(self), self._eq_getter(other))
+            for this, that in pairs:
+                # Identical attributes are trivially equal.
+                if this is not that and not is_equal(this, that):
                     return False
             return True
         return False
@@ -322,6 +373,19 @@ class CCLAutoRepr(CCLObject):
                 other = 19
     """
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        # Prepare what the representation needs once per class, rather than
+        # every time an instance is represented.
+        if hasattr(cls, "__repr_attrs__"):
+            cls._repr_getter = staticmethod(
+                _tuple_attrgetter(cls.__repr_attrs__))
+            cls._repr_defaults = {
+                param: value.default
+                for param, value in cls.__signature__.parameters.items()
+                if param != "self"}
+
     def __repr__(self):
         # Build string from specified `__repr_attrs__` or use Python's default.
         # Subclasses overriding `__repr__`, stop using `__repr_attrs__`.
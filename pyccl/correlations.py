@@ -121,7 +121,7 @@ def correlation(cosmo, *, ell, C_ell, theta, type='NN', method='fftlog'):
 
     if np.all(np.array(C_ell) == 0):
         # short-cut and also avoid integration errors
-        wth = np.zeros_like(theta)
+        wth = np.zeros_like(theta, dtype=float)
     else:
         # Call correlation function
         wth, status = lib.correlation_vec(cosmo, ell, C_ell, theta,
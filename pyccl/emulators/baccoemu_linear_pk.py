@@ -115,5 +115,7 @@ a_min,a_max = ({}, {})""".format(
                            * (growth_factors / ref_growth_factor)**2).T
         # now we combine the extrapolated and direct spectra
         pk_final = np.concatenate([pk_extrapolated, pk])
-        return Pk2D(a_arr=a, lk_arr=np.log(k), pk_arr=np.log(pk_final),
+        # `pk_final` is a new array, so take the logarithm in place
+        np.log(pk_final, out=pk_final)
+        return Pk2D(a_arr=a, lk_arr=np.log(k), pk_arr=pk_final,
                     is_logp=True, extrap_order_lok=1, extrap_order_hik=2)
@@ -38,10 +38,17 @@ class CosmicemuBase(EmulatorPk):
         """
 
     @abstractmethod
+    def _get_lpk_full(self, cosmo):
+        """ Computes the natural logarithm of the power spectrum at full
+        grid of redshifts and k for this cosmology.
+        """
+
     def _get_pk_full(self, cosmo):
         """ Computes power spectrum at full grid of redshifts and k
         for this cosmology.
         """
+        z, ks, lpk = self._get_lpk_full(cosmo)
+        return z, ks, np.exp(lpk)
 
     def _cosmo_to_x(self, cosmo):
         # Translates cosmology to an array of parameters used
@@ -64,8 +71,9 @@ class CosmicemuBase(EmulatorPk):
         return ks, pks
 
     def _get_pk2d(self, cosmo):
-        z, ks, pk = self._get_pk_full(cosmo)
-        return Pk2D(a_arr=1./(1+z), lk_arr=np.log(ks), pk_arr=np.log(pk),
+        # The emulator works in log-space, so skip the exp-log round trip.
+        z, ks, lpk = self._get_lpk_full(cosmo)
+        return Pk2D(a_arr=1./(1+z), lk_arr=np.log(ks), pk_arr=lpk,
                     is_logp=True, extrap_order_lok=1, extrap_order_hik=2)
 
 
@@ -127,9 +135,9 @@ class CosmicemuMTIIPk(CosmicemuBase):
             kb = np.linalg.solve(sigma_sim, self.w[j])
             self.KrigBasis.append(kb)
 
-    def _get_pk_full(self, cosmo):
-        # Computes power spectrum at full grid of redshifts and k
-        # for this cosmology.
+    def _get_lpk_full(self, cosmo):
+        # Computes log of the power spectrum at full grid of redshifts
+        # and k for this cosmology.
         xstar = self._cosmo_to_x(cosmo)
         # Check for out of bounds
         out_of_bounds = (xstar < self.xmin) | (xstar > self.xmax)
@@ -154,8 +162,9 @@ class CosmicemuMTIIPk(CosmicemuBase):
         # Project and reshape
         ystaremu = (np.dot(self.K, wstar)*self.sd+self.mean).reshape([self.nz,
                                                                       self.nk])
-        pk = 10**ystaremu*2*np.pi**2/self.ks**1.5
-        return self.z, self.ks, pk
+        # The emulator predicts log10(k^1.5 * P(k) / (2 * pi^2)).
+        lpk = ystaremu*np.log(10)+np.log(2*np.pi**2/self.ks**1.5)
+        return self.z, self.ks, lpk
 
 
 class CosmicemuMTIVPk(CosmicemuBase):
@@ -217,9 +226,9 @@ class CosmicemuMTIVPk(CosmicemuBase):
         self.pnames = ['omega_m', 'omega_b', 'sigma8', 'h', 'n_s',
                        'w_0', 'wtild', 'omega_nu']
 
-    def _get_pk_full(self, cosmo):
-        # Computes power spectrum at full grid of redshifts and k
-        # for this cosmology.
+    def _get_lpk_full(self, cosmo):
+        # Computes log of the power spectrum at full grid of redshifts
+        # and k for this cosmology.
         xstar = self._cosmo_to_x(cosmo)
         # Check for out of bounds
         out_of_bounds = (xstar < self.xmin) | (xstar > self.xmax)
@@ -239,5 +248,6 @@ class CosmicemuMTIVPk(CosmicemuBase):
         wstar = np.sum(Sigmastar*self.KrigBasis, axis=-1)
         ystaremu = (np.dot(self.K, wstar)*self.sd+self.mean).reshape([self.nz,
                                                                       self.nk])
-        pk = 10**ystaremu*2*np.pi**2/self.ks**1.5
-        return self.z, self.ks, pk
+        # The emulator predicts log10(k^1.5 * P(k) / (2 * pi^2)).
+        lpk = ystaremu*np.log(10)+np.log(2*np.pi**2/self.ks**1.5)
+        return self.z, self.ks, lpk
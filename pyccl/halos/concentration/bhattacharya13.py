@@ -15,6 +15,10 @@ class ConcentrationBhattacharya13(Concentration):
             definition object or name string.
     """
     name = 'Bhattacharya13'
+    # key: mass definition name, value: (A, B, C)
+    _fit_params = {"vir": (7.7, 0.9, -0.29),
+                   "200m": (9.0, 1.15, -0.29),
+                   "200c": (5.9, 0.54, -0.35)}
 
     def __init__(self, *, mass_def="200c"):
         super().__init__(mass_def=mass_def)
@@ -23,11 +27,7 @@ class ConcentrationBhattacharya13(Concentration):
         return mass_def.name not in ["vir", "200m", "200c"]
 
     def _setup(self):
-        vals = {"vir": (7.7, 0.9, -0.29),
-                "200m": (9.0, 1.15, -0.29),
-                "200c": (5.9, 0.54, -0.35)}
-
-        self.A, self.B, self.C = vals[self.mass_def.name]
+        self.A, self.B, self.C = self._fit_params[self.mass_def.name]
 
     def _concentration(self, cosmo, M, a):
         gz = cosmo.growth_factor(a)
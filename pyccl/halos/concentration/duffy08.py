@@ -15,6 +15,10 @@ class ConcentrationDuffy08(Concentration):
             definition object, or a name string.
     """
     name = 'Duffy08'
+    # key: mass definition name, value: (A, B, C)
+    _fit_params = {"vir": (7.85, -0.081, -0.71),
+                   "200m": (10.14, -0.081, -1.01),
+                   "200c": (5.71, -0.084, -0.47)}
 
     def __init__(self, *, mass_def="200c"):
         super().__init__(mass_def=mass_def)
@@ -23,12 +27,11 @@ class ConcentrationDuffy08(Concentration):
         return mass_def.name not in ["vir", "200m", "200c"]
 
     def _setup(self):
-        vals = {"vir": (7.85, -0.081, -0.71),
-                "200m": (10.14, -0.081, -1.01),
-                "200c": (5.71, -0.084, -0.47)}
-
-        self.A, self.B, self.C = vals[self.mass_def.name]
+        self.A, self.B, self.C = self._fit_params[self.mass_def.name]
 
     def _concentration(self, cosmo, M, a):
+        # Fold the (scalar) pivot mass into the amplitude so that only a
+        # single power of the mass array is needed.
         M_pivot_inv = cosmo["h"] * 5E-13
-        return self.A * (M * M_pivot_inv)**self.B * a**(-self.C)
+        A = self.A * M_pivot_inv**self.B * a**(-self.C)
+        return A * M**self.B
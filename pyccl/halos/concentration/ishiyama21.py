@@ -28,6 +28,18 @@ class ConcentrationIshiyama21(Concentration):
     """
     __repr_attrs__ = __eq_attrs__ = ("mass_def", "relaxed", "Vmax",)
     name = 'Ishiyama21'
+    # key: (Vmax, relaxed, Delta)
+    _fit_params = {
+        (True, True, 200): (1.79, 2.15, 2.06, 0.88, 9.24, 0.51),
+        (True, False, 200): (1.10, 2.30, 1.64, 1.72, 3.60, 0.32),
+        (False, True, 200): (0.60, 2.14, 2.63, 1.69, 6.36, 0.37),
+        (False, False, 200): (1.19, 2.54, 1.33, 4.04, 1.21, 0.22),
+        (True, True, "vir"): (2.40, 2.27, 1.80, 0.56, 13.24, 0.079),
+        (True, False, "vir"): (0.76, 2.34, 1.82, 1.83, 3.52, -0.18),
+        (False, True, "vir"): (1.22, 2.52, 1.87, 2.13, 4.19, -0.017),
+        (False, False, "vir"): (1.64, 2.67, 1.23, 3.92, 1.30, -0.19),
+        (False, True, 500): (0.38, 1.44, 3.41, 2.86, 2.99, 0.42),
+        (False, False, 500): (1.83, 1.95, 1.17, 3.57, 0.91, 0.26)}
 
     def __init__(self, *, mass_def="500c",
                  relaxed=False, Vmax=False):
@@ -40,21 +52,9 @@ class ConcentrationIshiyama21(Concentration):
         return mass_def.name not in ["vir", "200c", "500c"] or is_500Vmax
 
     def _setup(self):
-        # key: (Vmax, relaxed, Delta)
-        vals = {(True, True, 200): (1.79, 2.15, 2.06, 0.88, 9.24, 0.51),
-                (True, False, 200): (1.10, 2.30, 1.64, 1.72, 3.60, 0.32),
-                (False, True, 200): (0.60, 2.14, 2.63, 1.69, 6.36, 0.37),
-                (False, False, 200): (1.19, 2.54, 1.33, 4.04, 1.21, 0.22),
-                (True, True, "vir"): (2.40, 2.27, 1.80, 0.56, 13.24, 0.079),
-                (True, False, "vir"): (0.76, 2.34, 1.82, 1.83, 3.52, -0.18),
-                (False, True, "vir"): (1.22, 2.52, 1.87, 2.13, 4.19, -0.017),
-                (False, False, "vir"): (1.64, 2.67, 1.23, 3.92, 1.30, -0.19),
-                (False, True, 500): (0.38, 1.44, 3.41, 2.86, 2.99, 0.42),
-                (False, False, 500): (1.83, 1.95, 1.17, 3.57, 0.91, 0.26)}
-
         key = (self.Vmax, self.relaxed, self.mass_def.Delta)
         self.kappa, self.a0, self.a1, \
-            self.b0, self.b1, self.c_alpha = vals[key]
+            self.b0, self.b1, self.c_alpha = self._fit_params[key]
 
     def _dlsigmaR(self, cosmo, M, a):
         # kappa multiplies radius, so in log, 3*kappa multiplies mass
@@ -67,31 +67,58 @@ class ConcentrationIshiyama21(Concentration):
         return -3/np.log(10) * dlns_dlogM
 
     def _G(self, x, n_eff):
-        fx = np.log(1 + x) - x / (1 + x)
+        fx = np.log1p(x) - x / (1 + x)
         G = x / fx**((5 + n_eff) / 6)
         return G
 
     def _G_inv(self, arg, n_eff):
         # Numerical calculation of the inverse of `_G`.
-        roots = []
-        for val, neff in zip(arg, n_eff):
+        # Solve for all masses at once with Newton's method in log(x), using
+        # d log(G) / d log(x) = 1 - p * x^2 / ((1+x)^2 * f(x)).
+        # We only keep the roots that `brentq` would have found with the
+        # same bracket, i.e. if there is a sign change in [0.05, 200].
+        x_min, x_max = 0.05, 200
+        found = (self._G(x_min, n_eff) - arg) * (self._G(x_max, n_eff) - arg)
+        found = found < 0
+
+        p = (5 + n_eff) / 6
+        lnarg = np.log(arg)
+        lnx = np.full_like(arg, np.log(3.))
+        with np.errstate(all="ignore"):
+            for _ in range(50):
+                x = np.exp(lnx)
+                fx = np.log1p(x) - x / (1 + x)
+                step = (lnx - p * np.log(fx) - lnarg) / \
+                    (1 - p * x**2 / ((1 + x)**2 * fx))
+                lnx -= step
+                if np.all(np.abs(step[found]) < 1e-12):
+                    break
+        roots = np.exp(lnx)
+        found &= (np.abs(step) < 1e-12) & (roots > x_min) & (roots < x_max)
+        if np.all(found):
+            return roots
+
+        # Fall back to scalar root finding for whatever did not converge.
+        for i in np.flatnonzero(~found):
+            val, neff = arg[i], n_eff[i]
             func = lambda x: self._G(x, neff) - val  # noqa: _G_inv Traceback
             try:
-                rt = brentq(func, a=0.05, b=200)
+                rt = brentq(func, a=x_min, b=x_max)
             except ValueError:
                 # No root in [0.05, 200] (rare, but it may happen).
                 rt = root_scalar(func, x0=1, x1=2).root.item()
-            roots.append(rt)
-        return np.asarray(roots)
+            roots[i] = rt
+        return roots
 
     def _concentration(self, cosmo, M, a):
         nu = get_delta_c(cosmo, a, 'EdS_approx') / cosmo.sigmaM(M, a)
-        n_eff = -2 * self._dlsigmaR(cosmo, M, a) - 3
+        n3 = -2 * self._dlsigmaR(cosmo, M, a)  # n_eff + 3
+        n_eff = n3 - 3
         alpha_eff = cosmo.growth_rate(a)
 
-        A = self.a0 * (1 + self.a1 * (n_eff + 3))
-        B = self.b0 * (1 + self.b1 * (n_eff + 3))
+        A = self.a0 * (1 + self.a1 * n3)
+        B = self.b0 * (1 + self.b1 * n3)
         C = 1 - self.c_alpha * (1 - alpha_eff)
-        arg = A / nu * (1 + nu**2 / B)
+        arg = A / nu * (1 + nu * nu / B)
         G = self._G_inv(arg, n_eff)
         return C * G
@@ -1,5 +1,6 @@
 __all__ = ("MassFuncTinker08",)
 
+from functools import cached_property
 import numpy as np
 from scipy.interpolate import interp1d
 
@@ -32,24 +33,55 @@ class MassFuncTinker08(MassFunc):
     def _setup(self):
         delta = np.array(
             [200., 300., 400., 600., 800., 1200., 1600., 2400., 3200.])
-        alpha = np.array(
-            [0.186, 0.200, 0.212, 0.218, 0.248, 0.255, 0.260, 0.260, 0.260])
-        beta = np.array(
-            [1.47, 1.52, 1.56, 1.61, 1.87, 2.13, 2.30, 2.53, 2.66])
-        gamma = np.array(
-            [2.57, 2.25, 2.05, 1.87, 1.59, 1.51, 1.46, 1.44, 1.41])
-        phi = np.array(
-            [1.19, 1.27, 1.34, 1.45, 1.58, 1.80, 1.97, 2.24, 2.44])
-        ldelta = np.log10(delta)
-        self.pA0 = interp1d(ldelta, alpha)
-        self.pa0 = interp1d(ldelta, beta)
-        self.pb0 = interp1d(ldelta, gamma)
-        self.pc = interp1d(ldelta, phi)
+        # Rows: A0, a0, b0 and c as a function of Delta (Table 2).
+        self._coeffs = np.array([
+            [0.186, 0.200, 0.212, 0.218, 0.248, 0.255, 0.260, 0.260, 0.260],
+            [1.47, 1.52, 1.56, 1.61, 1.87, 2.13, 2.30, 2.53, 2.66],
+            [2.57, 2.25, 2.05, 1.87, 1.59, 1.51, 1.46, 1.44, 1.41],
+            [1.19, 1.27, 1.34, 1.45, 1.58, 1.80, 1.97, 2.24, 2.44]])
+        self._ldelta = np.log10(delta)
+        # Slopes of the linear interpolation between tabulated values.
+        self._slopes = np.diff(self._coeffs) / np.diff(self._ldelta)
+        # Pivot of the redshift evolution of the b parameter (Eq. 8).
+        self._ldelta_piv = np.log10(75.)
+
+    # Interpolators of the coefficients in log10(Delta), kept for
+    # backwards compatibility.
+    @cached_property
+    def pA0(self):
+        return interp1d(self._ldelta, self._coeffs[0])
+
+    @cached_property
+    def pa0(self):
+        return interp1d(self._ldelta, self._coeffs[1])
+
+    @cached_property
+    def pb0(self):
+        return interp1d(self._ldelta, self._coeffs[2])
+
+    @cached_property
+    def pc(self):
+        return interp1d(self._ldelta, self._coeffs[3])
 
     def _get_fsigma(self, cosmo, sigM, a, lnM):
         ld = np.log10(self.mass_def._get_Delta_m(cosmo, a))
-        pA = self.pA0(ld) * a**0.14
-        pa = self.pa0(ld) * a**0.06
-        pd = 10.**(-(0.75/(ld - 1.8750612633))**1.2)
-        pb = self.pb0(ld) * a**pd
-        return pA * ((pb / sigM)**pa + 1) * np.exp(-self.pc(ld)/sigM**2)
+        if not self._ldelta[0] <= ld <= self._ldelta[-1]:
+            raise ValueError("Tinker08 is only defined for overdensities "
+                             "200 <= Delta_m <= 3200.")
+        # Interpolate all four coefficients from a single table lookup.
+        i = min(np.searchsorted(self._ldelta, ld, side="right") - 1,
+                self._ldelta.size - 2)
+        pA0, pa0, pb0, pc = (self._coeffs[:, i]
+                             + self._slopes[:, i] * (ld - self._ldelta[i]))
+        pA = pA0 * a**0.14
+        pa = pa0 * a**0.06
+        pd = 10.**(-(0.75/(ld - self._ldelta_piv))**1.2)
+        pb = pb0 * a**pd
+        # pA * ((pb / sigM)**pa + 1) * exp(-pc / sigM**2), updating the
+        # first factor in place.
+        f = pb / sigM
+        f **= pa
+        f += 1
+        f *= np.exp(-pc / (sigM * sigM))
+        f *= pA
+        return f
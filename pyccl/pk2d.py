@@ -468,7 +468,37 @@ class Pk2D(CCLObject):
         return self + (-1)*other
 
     def __truediv__(self, other):
-        return self * other**(-1)
+        """Divide two Pk2D instances.
+
+        The a and k ranges of the 2nd operand need to be the same or smaller
+        than the 1st operand.
+        The returned Pk2D object uses the same a and k arrays as the first
+        operand.
+        """
+        # Divide the arrays directly, rather than computing `other**(-1)`,
+        # which would build (and discard) an intermediate spline.
+        if isinstance(other, (float, int)):
+            if other == 0:
+                raise ZeroDivisionError("Division of Pk2D by zero.")
+            a_arr_a, lk_arr_a, pk_arr_a = self.get_spline_arrays()
+            pk_arr_new = pk_arr_a / other
+        elif isinstance(other, Pk2D):
+            a_arr_a, lk_arr_a, pk_arr_a, pk_arr_b = \
+                self._get_binary_operator_arrays(other)
+            pk_arr_new = pk_arr_a / pk_arr_b
+        else:
+            raise TypeError("Division of Pk2D is only defined for "
+                            "floats, ints, and Pk2D objects.")
+
+        logp = np.all(pk_arr_new > 0)
+        if logp:
+            pk_arr_new = np.log(pk_arr_new)
+
+        new = Pk2D(a_arr=a_arr_a, lk_arr=lk_arr_a, pk_arr=pk_arr_new,
+                   is_logp=logp,
+                   extrap_order_lok=self.extrap_order_lok,
+                   extrap_order_hik=self.extrap_order_hik)
+        return new
 
     __radd__ = __add__
 
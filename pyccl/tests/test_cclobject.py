@@ -166,3 +166,52 @@ def test_unlock_instance_errors():
     # 3. Doesn't do anything if instance is not CCLObject.
     with ccl.UnlockInstance(True, mutate=False):
         pass
+
+
+def test_unlock_instance_lookup():
+    # Test that the instance is unlocked however it is passed.
+    def check_unlocked(obj):
+        assert obj._object_lock.active
+        assert not obj._object_lock.locked
+
+    @ccl.unlock_instance(name="obj")
+    def func1(a0, obj, a1=None):
+        check_unlocked(obj)
+
+    @ccl.unlock_instance(name="obj")
+    def func2(a0, *, obj, a1=None):
+        check_unlocked(obj)
+
+    calls = [lambda obj: func1(0, obj),  # positional
+             lambda obj: func1(0, obj=obj, a1=1),  # keyword
+             lambda obj: func2(0, obj=obj)]  # keyword-only
+    for call in calls:
+        obj = ccl.CCLObject()
+        obj._object_lock.lock()
+        assert not obj._object_lock.active
+        call(obj)
+
+    # Invalid calls go through `Signature.bind`, which raises.
+    with pytest.raises(TypeError):
+        func2(0, 1)
+
+
+def test_Funlock_skips_unlocked_methods():
+    # Test that `Funlock` does not wrap an already decorated method again.
+    class MyType(ccl.CCLObject):
+        @ccl.unlock_instance
+        def update_parameters(self, **kwargs):
+            return
+
+        def other_method(self):
+            return
+
+    func = vars(MyType)["update_parameters"]
+    ccl.UnlockInstance.Funlock(MyType, "update_parameters", mutate=True)
+    assert vars(MyType)["update_parameters"] is func
+
+    # Undecorated methods are still wrapped.
+    func = vars(MyType)["other_method"]
+    ccl.UnlockInstance.Funlock(MyType, "other_method", mutate=True)
+    assert vars(MyType)["other_method"] is not func
+    assert vars(MyType)["other_method"].__wrapped__ is func
@@ -69,6 +69,31 @@ def test_cM_mdef_raises(cM_class):
             cM_class(mass_def="200m")
 
 
+def test_cM_ishiyama21_G_inv():
+    cM = ccl.halos.ConcentrationIshiyama21()
+    # All roots lie within [0.05, 200].
+    n_eff = np.linspace(-2.7, -1.3, 8)
+    x = np.geomspace(0.5, 100, 8)
+    arg = cM._G(x, n_eff)
+    x_inv = cM._G_inv(arg, n_eff)
+    assert np.allclose(cM._G(x_inv, n_eff), arg, rtol=1E-10, atol=0)
+    assert np.allclose(x_inv, x, rtol=1E-8, atol=0)
+
+
+def test_cM_ishiyama21_G_inv_unbracketed():
+    cM = ccl.halos.ConcentrationIshiyama21()
+    # The last two roots lie outside of [0.05, 200], so they are only
+    # found by the scalar fallback.
+    n_eff = np.array([-2.3, -2.0, -2.3, -2.0])
+    x = np.array([2., 10., 0.01, 300.])
+    arg = cM._G(x, n_eff)
+    bracketed = (cM._G(0.05, n_eff) - arg) * (cM._G(200, n_eff) - arg) < 0
+    assert np.all(bracketed == [True, True, False, False])
+    x_inv = cM._G_inv(arg, n_eff)
+    assert np.allclose(cM._G(x_inv, n_eff), arg, rtol=1E-10, atol=0)
+    assert np.allclose(x_inv, x, rtol=1E-8, atol=0)
+
+
 @pytest.mark.parametrize('name', ['Duffy08', 'Diemer15'])
 def test_cM_from_string(name):
     cM_class = ccl.halos.Concentration.from_name(name)
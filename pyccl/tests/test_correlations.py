@@ -122,6 +122,10 @@ def test_correlation_zero():
     assert t1 - t0 < 1.0
     assert (corr == np.zeros(theta.size)).all()
 
+    # Integer angles still give a floating-point result
+    corr = ccl.correlation(COSMO, ell=ell, C_ell=C_ell, theta=2)
+    assert isinstance(corr, float) and corr == 0
+
 
 def test_correlation_zero_ends():
     # This should give an error instead of crashing
@@ -128,6 +128,28 @@ def test_nM_tinker_crit(mf):
     assert np.allclose(nM_c(COSMO, 1E13, a), nM_m(COSMO, 1E13, a))
 
 
+def test_nM_tinker08_fsigma_scalar():
+    # _get_fsigma must also work for scalar sigma(M)
+    mf = ccl.halos.MassFuncTinker08()
+    sigM = np.array([0.5, 1.0, 2.0])
+    f_arr = mf._get_fsigma(COSMO, sigM, 0.9, 1)
+    for s, f in zip(sigM, f_arr):
+        f_scl = mf._get_fsigma(COSMO, float(s), 0.9, 1)
+        assert np.ndim(f_scl) == 0
+        assert np.isclose(f_scl, f, rtol=1E-12)
+
+
+def test_nM_tinker08_coefficient_interpolators():
+    mf = ccl.halos.MassFuncTinker08()
+    ld = np.log10([200., 500., 3200.])
+    assert np.allclose(mf.pA0(ld), np.interp(ld, mf._ldelta, mf._coeffs[0]))
+    assert np.allclose(mf.pc(ld[[0, -1]]), [1.19, 2.44])
+    # The interpolators are only built once.
+    assert mf.pb0 is mf.pb0
+    with pytest.raises(ValueError):
+        mf.pa0(np.log10(100.))
+
+
 def test_nM_tinker10_norm():
     from scipy.integrate import quad
 
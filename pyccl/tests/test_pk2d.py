@@ -434,8 +434,9 @@ def test_pk2d_copy():
 
 
 def test_pk2d_operations():
-    # Everything is based on the already tested `add`, `mul`, and `pow`,
-    # so we don't need to test every accepted type separately.
+    # `sub` and `rtruediv` are based on the already tested `add`, `mul`,
+    # and `pow`, so we don't need to test every accepted type separately.
+    # `truediv` divides the arrays directly, so it is tested more fully.
     x = np.linspace(0.1, 1, 10)
     log_y = np.linspace(-3, 1, 20)
     zarr_a = np.outer(x, np.exp(log_y))
@@ -445,6 +446,20 @@ def test_pk2d_operations():
     # sub, truediv
     assert np.allclose((pk1 - pk2).get_spline_arrays()[-1], 0, rtol=1e-15)
     assert np.allclose((pk1 / pk2).get_spline_arrays()[-1], 1, rtol=1e-15)
+    assert np.allclose((pk1 / 2).get_spline_arrays()[-1], zarr_a / 2)
+    with pytest.raises(ZeroDivisionError):
+        pk1 / 0
+    # truediv is only defined for float, int, and Pk2D
+    with pytest.raises(TypeError):
+        pk1 / np.array([0.1, 0.2])
+    # truediv on different supports interpolates the 2nd operand
+    pk3 = ccl.Pk2D(a_arr=x[1:-1], lk_arr=log_y[1:-1],
+                   pk_arr=3*zarr_a[1:-1, 1:-1], is_logp=False)
+    with pytest.warns(CCLWarning):
+        pk4 = pk3 / pk1
+    assert np.allclose(pk4.get_spline_arrays()[-1], 3)
+    with pytest.raises(ValueError):
+        pk1 / pk3
 
     # rsub, rtruediv
     assert np.allclose((1 - pk1).get_spline_arrays()[-1],